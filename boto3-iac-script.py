@@ -1,31 +1,316 @@
+import base64
 import boto3
+import functools
+import gzip
+import os
+import random
 import time
 import json
+import logging
 
-# Initialize AWS clients
-ec2 = boto3.client('ec2', region_name='us-west-1')
-autoscaling = boto3.client('autoscaling', region_name='us-west-1')
-elbv2 = boto3.client('elbv2', region_name='us-west-1')
-iam = boto3.client('iam', region_name='us-west-1')
-ecr = boto3.client('ecr', region_name='us-west-1')
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json where orjson is unavailable
+    orjson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+logger = logging.getLogger('orc-iac')
+
+# Initialize AWS clients from a single shared session. One session means one
+# credential resolution and reused HTTPS connection pools instead of a fresh
+# TLS handshake per client; the enlarged pool keeps the thread fan-out from
+# saturating the default 10 connections, and adaptive retry mode applies
+# AWS-recommended token-bucket backoff when the API throttles us.
+session = boto3.session.Session()
+client_config = Config(
+    region_name='us-west-1',
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
+)
+ec2 = session.client('ec2', config=client_config)
+autoscaling = session.client('autoscaling', config=client_config)
+elbv2 = session.client('elbv2', config=client_config)
+iam = session.client('iam', config=client_config)
+ecr = session.client('ecr', config=client_config)
+
+# Shared executor for fanning out independent API calls. Reused across all
+# deployment phases so each phase does not pay thread-pool spin-up/teardown.
+executor = ThreadPoolExecutor(max_workers=8)
+
+# On-disk cache for the AZ list - it is effectively static per account, so
+# repeated runs (rollbacks, retries, CI) should not re-pay the API call
+AZ_CACHE_FILE = '.az_cache.json'
+AZ_CACHE_TTL = 24 * 60 * 60  # seconds
+
+ECR_REGISTRY = '975050024946.dkr.ecr.us-west-1.amazonaws.com'
+ECR_REPO = f'{ECR_REGISTRY}/aakash/project-orc-b'
+
+# (image tag, port) for each backend service baked into the launch template
+BACKEND_SERVICES = [('hello-latest', 3001), ('profile-latest', 3002)]
+
+# Base Amazon Linux 2 AMI for us-west-1. Point PROJECTORC_PREBAKED_AMI at an
+# image baked with docker, the AWS CLI, and the service images pre-pulled
+# (EC2 Image Builder / Packer) and boot skips the yum + ECR-login + pull
+# work entirely - scale-out time-to-ready drops from ~2 minutes to ~20s.
+BASE_AMI_ID = 'ami-0c110e13b02dea71a'  # Amazon Linux 2 in us-west-1, update as needed
+AMI_ID = os.environ.get('PROJECTORC_PREBAKED_AMI', BASE_AMI_ID)
+AMI_IS_PREBAKED = AMI_ID != BASE_AMI_ID
+
+def build_user_data(services, prebaked=AMI_IS_PREBAKED):
+    """Render the boot script that pulls and runs the given (tag, port) services"""
+    if prebaked:
+        # Docker and the images are already on the AMI - just start things
+        lines = [
+            '#!/bin/bash',
+            'systemctl start docker',
+        ]
+    else:
+        lines = [
+            '#!/bin/bash',
+            'yum update -y',
+            'yum install -y docker',
+            'systemctl start docker',
+            'systemctl enable docker',
+            'amazon-linux-extras install -y aws-cli',
+            f'aws ecr get-login-password --region us-west-1 | docker login --username AWS --password-stdin {ECR_REGISTRY}',
+        ]
+        # Pulls are network-bound and independent, so background them and
+        # wait. Cuts warm-up by roughly one pull per extra service, which
+        # gates how fast ALB targets come healthy.
+        for tag, _ in services:
+            lines.append(f'docker pull {ECR_REPO}:{tag} &')
+        lines.append('wait')
+    for tag, port in services:
+        lines.append(f'docker run -d -p {port}:{port} {ECR_REPO}:{tag} &')
+    lines.append('wait')
+    return '\n'.join(lines) + '\n'
+
+def encode_user_data(user_data):
+    """Gzip + base64 the boot script - gzip roughly halves the payload and
+    cloud-init decompresses it transparently, which matters against the 16KB
+    EC2 user-data cap as the script grows"""
+    return base64.b64encode(gzip.compress(user_data.encode())).decode()
+
+# Encoded once at module scope so repeated launch-template calls do no work
+BACKEND_USER_DATA_B64 = encode_user_data(build_user_data(BACKEND_SERVICES))
+
+# Serialized once so the payload sent to IAM is byte-identical across runs
+ASSUME_ROLE_POLICY_JSON = json.dumps({
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"Service": "ec2.amazonaws.com"},
+            "Action": "sts:AssumeRole"
+        }
+    ]
+}, separators=(',', ':'))
+
+# Describe-before-create results, keyed by (resource type, Name tag), so a
+# re-run resolves each existing resource with at most one Describe call
+_resource_cache = {}
+
+def _find_existing(resource_type, name, describe, result_key, id_key, filters=None):
+    """Return the ID of an already-created resource by Name tag, or None"""
+    key = (resource_type, name)
+    if key not in _resource_cache:
+        response = describe(Filters=filters or [{'Name': 'tag:Name', 'Values': [name]}])
+        items = response.get(result_key, [])
+        _resource_cache[key] = items[0][id_key] if items else None
+    return _resource_cache[key]
+
+def _tag(resource_type, name):
+    """Build the TagSpecifications boilerplate for a Name-tagged resource"""
+    return [
+        {
+            'ResourceType': resource_type,
+            'Tags': [{'Key': 'Name', 'Value': name}]
+        }
+    ]
+
+def _associate_route_table(rt_id, subnet_id):
+    """Associate a subnet with a route table, backing off under throttling"""
+    for attempt in range(6):
+        try:
+            return ec2.associate_route_table(
+                RouteTableId=rt_id,
+                SubnetId=subnet_id
+            )
+        except ClientError as e:
+            # A previous run may have made this association before dying, so
+            # an existing association is success, not an error
+            if e.response['Error']['Code'] == 'Resource.AlreadyAssociated':
+                return None
+            if e.response['Error']['Code'] != 'RequestLimitExceeded':
+                raise
+            time.sleep(min(60, 2 ** attempt + random.random()))
+    raise Exception(f"Could not associate subnet {subnet_id} with route table {rt_id}")
+
+@functools.lru_cache(maxsize=1)
+def _describe_azs(region):
+    """Return availability zone names for a region, cached on disk for 24h"""
+    try:
+        if time.time() - os.path.getmtime(AZ_CACHE_FILE) < AZ_CACHE_TTL:
+            with open(AZ_CACHE_FILE, 'r') as f:
+                cache = json.load(f)
+            if region in cache:
+                return cache[region]
+    except (OSError, ValueError):
+        pass
+
+    response = ec2.describe_availability_zones(
+        Filters=[{'Name': 'region-name', 'Values': [region]}]
+    )
+    azs = [az['ZoneName'] for az in response['AvailabilityZones']]
+    with open(AZ_CACHE_FILE, 'w') as f:
+        json.dump({region: azs}, f)
+    return azs
+
+def _reuse_existing_vpc(vpc_id):
+    """Rebuild the create_vpc return payload from already-created resources.
+
+    A previous run may have died part-way through create_vpc, so every piece
+    is checked individually and created when missing instead of assuming the
+    stack is either absent or complete.
+    """
+    igw_response = ec2.describe_internet_gateways(
+        Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]}]
+    )
+    if igw_response['InternetGateways']:
+        igw_id = igw_response['InternetGateways'][0]['InternetGatewayId']
+    else:
+        igw_id = ec2.create_internet_gateway(
+            TagSpecifications=_tag('internet-gateway', 'ProjectOrcIGW')
+        )['InternetGateway']['InternetGatewayId']
+        ec2.attach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
+        logger.info(f"Created missing Internet Gateway: {igw_id}")
+
+    # Index the existing subnets by Name tag, then recreate any of the four
+    # expected subnets that are missing with the same deterministic CIDRs
+    # create_vpc would have used
+    response = ec2.describe_subnets(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])
+    found = {}
+    for subnet in response['Subnets']:
+        name = next((t['Value'] for t in subnet.get('Tags', []) if t['Key'] == 'Name'), '')
+        found[name] = subnet['SubnetId']
+
+    missing_args = []
+    for i, az in enumerate(_describe_azs('us-west-1')[:2]):
+        for scope, offset in (('Public', 0), ('Private', 1)):
+            name = f'ProjectOrc-{scope}-{i+1}'
+            if name not in found:
+                missing_args.append((name, {
+                    'VpcId': vpc_id,
+                    'CidrBlock': f'10.0.{i*2+offset}.0/24',
+                    'AvailabilityZone': az,
+                    'TagSpecifications': _tag('subnet', name)
+                }))
+    if missing_args:
+        responses = list(executor.map(lambda args: ec2.create_subnet(**args[1]), missing_args))
+        for (name, _), response in zip(missing_args, responses):
+            found[name] = response['Subnet']['SubnetId']
+            logger.info(f"Created missing subnet {name}: {found[name]}")
+
+    subnets = {'public': [], 'private': []}
+    for name in sorted(found):
+        scope = 'public' if 'Public' in name else 'private'
+        subnets[scope].append(found[name])
+
+    # modify_subnet_attribute is idempotent, so just reapply auto-assign
+    # public IP rather than tracking which subnets already have it
+    list(executor.map(
+        lambda subnet_id: ec2.modify_subnet_attribute(
+            SubnetId=subnet_id,
+            MapPublicIpOnLaunch={'Value': True}
+        ),
+        subnets['public']
+    ))
+
+    public_rt_id = _find_existing(
+        'route-table', 'ProjectOrc-PublicRT',
+        ec2.describe_route_tables, 'RouteTables', 'RouteTableId')
+    if public_rt_id is None:
+        public_rt_id = ec2.create_route_table(
+            VpcId=vpc_id,
+            TagSpecifications=_tag('route-table', 'ProjectOrc-PublicRT')
+        )['RouteTable']['RouteTableId']
+        ec2.create_route(
+            RouteTableId=public_rt_id,
+            DestinationCidrBlock='0.0.0.0/0',
+            GatewayId=igw_id
+        )
+        logger.info(f"Created missing public route table: {public_rt_id}")
+
+    private_rt_id = _find_existing(
+        'route-table', 'ProjectOrc-PrivateRT',
+        ec2.describe_route_tables, 'RouteTables', 'RouteTableId')
+    if private_rt_id is None:
+        private_rt_id = ec2.create_route_table(
+            VpcId=vpc_id,
+            TagSpecifications=_tag('route-table', 'ProjectOrc-PrivateRT')
+        )['RouteTable']['RouteTableId']
+        logger.info(f"Created missing private route table: {private_rt_id}")
+
+    # Re-assert every association - _associate_route_table treats an
+    # already-associated subnet as success, so this fills in whichever
+    # associations the earlier run never got to
+    associations = (
+        [(public_rt_id, subnet_id) for subnet_id in subnets['public']] +
+        [(private_rt_id, subnet_id) for subnet_id in subnets['private']]
+    )
+    list(executor.map(
+        lambda pair: _associate_route_table(pair[0], pair[1]),
+        associations
+    ))
+
+    # Reuse the NAT Gateway if one is up (or coming up); provision otherwise.
+    # Adoption still has to verify the private default route - see
+    # _reuse_nat_gateway
+    nat_response = ec2.describe_nat_gateways(Filters=[
+        {'Name': 'vpc-id', 'Values': [vpc_id]},
+        {'Name': 'state', 'Values': ['pending', 'available']}
+    ])
+    if nat_response['NatGateways']:
+        nat_gateway_id = nat_response['NatGateways'][0]['NatGatewayId']
+        nat_future = executor.submit(_reuse_nat_gateway, nat_gateway_id, private_rt_id)
+    else:
+        nat_future = executor.submit(_provision_nat_gateway, subnets['public'][0], private_rt_id)
+
+    return {
+        'vpc_id': vpc_id,
+        'igw_id': igw_id,
+        'subnets': subnets,
+        'public_rt_id': public_rt_id,
+        'private_rt_id': private_rt_id,
+        'nat_future': nat_future
+    }
 
 def create_vpc():
     """Create VPC and related resources"""
+    # Reuse the whole network stack when a previous run already built it
+    existing_vpc_id = _find_existing('vpc', 'ProjectOrcVPC', ec2.describe_vpcs, 'Vpcs', 'VpcId')
+    if existing_vpc_id:
+        logger.info(f"Reusing existing VPC: {existing_vpc_id}")
+        return _reuse_existing_vpc(existing_vpc_id)
+
     # Create VPC
     vpc_response = ec2.create_vpc(
         CidrBlock='10.0.0.0/16',
-        TagSpecifications=[
-            {
-                'ResourceType': 'vpc',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrcVPC'}]
-            }
-        ]
+        TagSpecifications=_tag('vpc', 'ProjectOrcVPC')
     )
     vpc_id = vpc_response['Vpc']['VpcId']
-    print(f"VPC created: {vpc_id}")
+    logger.info(f"VPC created: {vpc_id}")
 
-    # Wait for VPC to be available
-    ec2.get_waiter('vpc_available').wait(VpcIds=[vpc_id])
+    # Wait for VPC to be available - poll every 2s instead of the default
+    # 15s since VPCs are usually ready within a few seconds
+    ec2.get_waiter('vpc_available').wait(
+        VpcIds=[vpc_id],
+        WaiterConfig={'Delay': 2, 'MaxAttempts': 30}
+    )
 
     # Enable DNS hostnames for the VPC
     ec2.modify_vpc_attribute(
@@ -35,30 +320,21 @@ def create_vpc():
 
     # Create Internet Gateway
     igw_response = ec2.create_internet_gateway(
-        TagSpecifications=[
-            {
-                'ResourceType': 'internet-gateway',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrcIGW'}]
-            }
-        ]
+        TagSpecifications=_tag('internet-gateway', 'ProjectOrcIGW')
     )
     igw_id = igw_response['InternetGateway']['InternetGatewayId']
-    print(f"Internet Gateway created: {igw_id}")
+    logger.info(f"Internet Gateway created: {igw_id}")
 
     # Attach IGW to VPC
     ec2.attach_internet_gateway(
         InternetGatewayId=igw_id,
         VpcId=vpc_id
     )
-    print(f"Internet Gateway {igw_id} attached to VPC {vpc_id}")
+    logger.info(f"Internet Gateway {igw_id} attached to VPC {vpc_id}")
 
     # Create public and private subnets in different AZs
-    az_response = ec2.describe_availability_zones(
-        Filters=[{'Name': 'region-name', 'Values': ['us-west-1']}]
-    )
-    
-    available_azs = [az['ZoneName'] for az in az_response['AvailabilityZones']]
-    
+    available_azs = _describe_azs('us-west-1')
+
     # Ensure we have at least 2 AZs
     if len(available_azs) < 2:
         raise Exception("Need at least 2 availability zones")
@@ -67,224 +343,346 @@ def create_vpc():
         'public': [],
         'private': []
     }
-    
-    # Create 2 public and 2 private subnets (or as many as AZs available)
+
+    # Build args for 2 public and 2 private subnets (or as many as AZs available).
+    # All four subnets are independent, so they are created concurrently to
+    # avoid paying a serial API round-trip per subnet.
+    subnet_args = []
     for i, az in enumerate(available_azs[:2]):
-        # Public subnet
-        public_subnet = ec2.create_subnet(
-            VpcId=vpc_id,
-            CidrBlock=f'10.0.{i*2}.0/24',
-            AvailabilityZone=az,
-            TagSpecifications=[
-                {
-                    'ResourceType': 'subnet',
-                    'Tags': [{'Key': 'Name', 'Value': f'ProjectOrc-Public-{i+1}'}]
-                }
-            ]
-        )
-        public_subnet_id = public_subnet['Subnet']['SubnetId']
-        subnets['public'].append(public_subnet_id)
-        print(f"Public subnet created: {public_subnet_id} in {az}")
-        
-        # Enable auto-assign public IP for public subnets
-        ec2.modify_subnet_attribute(
-            SubnetId=public_subnet_id,
+        subnet_args.append(('public', {
+            'VpcId': vpc_id,
+            'CidrBlock': f'10.0.{i*2}.0/24',
+            'AvailabilityZone': az,
+            'TagSpecifications': _tag('subnet', f'ProjectOrc-Public-{i+1}')
+        }))
+        subnet_args.append(('private', {
+            'VpcId': vpc_id,
+            'CidrBlock': f'10.0.{i*2+1}.0/24',
+            'AvailabilityZone': az,
+            'TagSpecifications': _tag('subnet', f'ProjectOrc-Private-{i+1}')
+        }))
+
+    responses = list(executor.map(lambda args: ec2.create_subnet(**args[1]), subnet_args))
+    for (scope, args), response in zip(subnet_args, responses):
+        subnet_id = response['Subnet']['SubnetId']
+        subnets[scope].append(subnet_id)
+        logger.debug(f"{scope.capitalize()} subnet created: {subnet_id} in {args['AvailabilityZone']}")
+
+    # Enable auto-assign public IP for all public subnets concurrently
+    list(executor.map(
+        lambda subnet_id: ec2.modify_subnet_attribute(
+            SubnetId=subnet_id,
             MapPublicIpOnLaunch={'Value': True}
-        )
-        
-        # Private subnet
-        private_subnet = ec2.create_subnet(
-            VpcId=vpc_id,
-            CidrBlock=f'10.0.{i*2+1}.0/24',
-            AvailabilityZone=az,
-            TagSpecifications=[
-                {
-                    'ResourceType': 'subnet',
-                    'Tags': [{'Key': 'Name', 'Value': f'ProjectOrc-Private-{i+1}'}]
-                }
-            ]
-        )
-        private_subnet_id = private_subnet['Subnet']['SubnetId']
-        subnets['private'].append(private_subnet_id)
-        print(f"Private subnet created: {private_subnet_id} in {az}")
-    
+        ),
+        subnets['public']
+    ))
+
     # Create route tables
     # Public route table
     public_rt = ec2.create_route_table(
         VpcId=vpc_id,
-        TagSpecifications=[
-            {
-                'ResourceType': 'route-table',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-PublicRT'}]
-            }
-        ]
+        TagSpecifications=_tag('route-table', 'ProjectOrc-PublicRT')
     )
     public_rt_id = public_rt['RouteTable']['RouteTableId']
-    print(f"Public route table created: {public_rt_id}")
-    
+    logger.info(f"Public route table created: {public_rt_id}")
+
     # Add route to IGW
     ec2.create_route(
         RouteTableId=public_rt_id,
         DestinationCidrBlock='0.0.0.0/0',
         GatewayId=igw_id
     )
-    
-    # Associate public subnets with public route table
-    for subnet_id in subnets['public']:
-        ec2.associate_route_table(
-            RouteTableId=public_rt_id,
-            SubnetId=subnet_id
-        )
-        print(f"Associated public subnet {subnet_id} with route table {public_rt_id}")
-    
+
     # Private route table
     private_rt = ec2.create_route_table(
         VpcId=vpc_id,
-        TagSpecifications=[
-            {
-                'ResourceType': 'route-table',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-PrivateRT'}]
-            }
-        ]
+        TagSpecifications=_tag('route-table', 'ProjectOrc-PrivateRT')
     )
     private_rt_id = private_rt['RouteTable']['RouteTableId']
-    print(f"Private route table created: {private_rt_id}")
-    
-    # Associate private subnets with private route table
-    for subnet_id in subnets['private']:
-        ec2.associate_route_table(
-            RouteTableId=private_rt_id,
-            SubnetId=subnet_id
-        )
-        print(f"Associated private subnet {subnet_id} with route table {private_rt_id}")
-    
-    # Create NAT Gateway for outbound traffic from private subnets
+    logger.info(f"Private route table created: {private_rt_id}")
+
+    # Associate all subnets with their route tables concurrently - each
+    # association is an independent API call
+    associations = (
+        [(public_rt_id, subnet_id) for subnet_id in subnets['public']] +
+        [(private_rt_id, subnet_id) for subnet_id in subnets['private']]
+    )
+    list(executor.map(
+        lambda pair: _associate_route_table(pair[0], pair[1]),
+        associations
+    ))
+    for rt_id, subnet_id in associations:
+        logger.debug(f"Associated subnet {subnet_id} with route table {rt_id}")
+
+    # Provision the NAT Gateway in the background - only the final
+    # private-subnet default route depends on it, so the ~60s availability
+    # wait can hide behind security-group/launch-template/ALB setup.
+    # __main__ resolves this future right before the auto scaling group
+    # launches instances into the private subnets.
+    nat_future = executor.submit(_provision_nat_gateway, subnets['public'][0], private_rt_id)
+
+    return {
+        'vpc_id': vpc_id,
+        'igw_id': igw_id,
+        'subnets': subnets,
+        'public_rt_id': public_rt_id,
+        'private_rt_id': private_rt_id,
+        'nat_future': nat_future
+    }
+
+def _provision_nat_gateway(public_subnet_id, private_rt_id):
+    """Create the NAT Gateway, wait for it, and route private traffic to it"""
     eip = ec2.allocate_address(Domain='vpc')
     nat_gateway = ec2.create_nat_gateway(
         AllocationId=eip['AllocationId'],
-        SubnetId=subnets['public'][0],
-        TagSpecifications=[
-            {
-                'ResourceType': 'natgateway',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-NAT'}]
-            }
-        ]
+        SubnetId=public_subnet_id,
+        TagSpecifications=_tag('natgateway', 'ProjectOrc-NAT')
     )
     nat_gateway_id = nat_gateway['NatGateway']['NatGatewayId']
-    print(f"NAT Gateway created: {nat_gateway_id}")
-    
-    # Wait for NAT Gateway to be available
-    print("Waiting for NAT Gateway to be available...")
+    logger.info(f"NAT Gateway created: {nat_gateway_id}")
+
+    # Wait for NAT Gateway to be available - a 5s poll notices readiness up
+    # to 10s sooner than the default 15s delay without shortening the
+    # overall timeout
+    logger.info("Waiting for NAT Gateway to be available...")
     waiter = ec2.get_waiter('nat_gateway_available')
-    waiter.wait(NatGatewayIds=[nat_gateway_id])
-    
+    waiter.wait(
+        NatGatewayIds=[nat_gateway_id],
+        WaiterConfig={'Delay': 5, 'MaxAttempts': 60}
+    )
+
     # Add route to NAT Gateway for private subnets
     ec2.create_route(
         RouteTableId=private_rt_id,
         DestinationCidrBlock='0.0.0.0/0',
         NatGatewayId=nat_gateway_id
     )
-    print(f"Added route to NAT Gateway for private route table")
-    
-    return {
-        'vpc_id': vpc_id,
-        'igw_id': igw_id, 
-        'subnets': subnets,
-        'public_rt_id': public_rt_id,
-        'private_rt_id': private_rt_id,
-        'nat_gateway_id': nat_gateway_id
-    }
+    logger.info(f"Added route to NAT Gateway for private route table")
+
+    return nat_gateway_id
+
+def _reuse_nat_gateway(nat_gateway_id, private_rt_id):
+    """Adopt an existing NAT Gateway, repairing the private default route
+
+    _provision_nat_gateway only creates the 0.0.0.0/0 route after the ~60s
+    availability wait - the longest window in the script - so a prior run
+    killed mid-wait leaves a gateway with no egress route. Wait out a
+    still-pending gateway, then create the route if it is missing.
+    """
+    ec2.get_waiter('nat_gateway_available').wait(
+        NatGatewayIds=[nat_gateway_id],
+        WaiterConfig={'Delay': 5, 'MaxAttempts': 60}
+    )
+
+    routes = ec2.describe_route_tables(
+        RouteTableIds=[private_rt_id]
+    )['RouteTables'][0]['Routes']
+    if not any(route.get('DestinationCidrBlock') == '0.0.0.0/0' for route in routes):
+        ec2.create_route(
+            RouteTableId=private_rt_id,
+            DestinationCidrBlock='0.0.0.0/0',
+            NatGatewayId=nat_gateway_id
+        )
+        logger.info("Added missing NAT route to private route table")
+
+    return nat_gateway_id
+
+def _authorize_ingress(GroupId, IpPermissions):
+    """Authorize ingress rules, treating already-present rules as success"""
+    try:
+        ec2.authorize_security_group_ingress(GroupId=GroupId, IpPermissions=IpPermissions)
+    except ClientError as e:
+        # A previous run may have authorized some of these rules before
+        # dying. One duplicate fails the whole batch without applying the
+        # rest, so retry rule-by-rule to add whichever rules are missing
+        if e.response['Error']['Code'] != 'InvalidPermission.Duplicate':
+            raise
+        for permission in IpPermissions:
+            try:
+                ec2.authorize_security_group_ingress(
+                    GroupId=GroupId,
+                    IpPermissions=[permission]
+                )
+            except ClientError as retry_error:
+                if retry_error.response['Error']['Code'] != 'InvalidPermission.Duplicate':
+                    raise
 
 def create_security_groups(vpc_id):
     """Create security groups for load balancer and backend services"""
-    # ALB Security Group
-    alb_sg = ec2.create_security_group(
-        GroupName='ProjectOrc-ALB-SG',
-        Description='Security group for application load balancer',
-        VpcId=vpc_id,
-        TagSpecifications=[
-            {
-                'ResourceType': 'security-group',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-ALB-SG'}]
-            }
-        ]
-    )
-    alb_sg_id = alb_sg['GroupId']
-    print(f"ALB Security Group created: {alb_sg_id}")
-    
-    # Allow HTTP and HTTPS from anywhere to ALB
-    ec2.authorize_security_group_ingress(
-        GroupId=alb_sg_id,
-        IpPermissions=[
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 80,
-                'ToPort': 80,
-                'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
-            },
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 443,
-                'ToPort': 443,
-                'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
-            }
-        ]
-    )
-    
-    # Backend Services Security Group
-    backend_sg = ec2.create_security_group(
-        GroupName='ProjectOrc-Backend-SG',
-        Description='Security group for backend services',
-        VpcId=vpc_id,
-        TagSpecifications=[
-            {
-                'ResourceType': 'security-group',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-Backend-SG'}]
-            }
-        ]
-    )
-    backend_sg_id = backend_sg['GroupId']
-    print(f"Backend Security Group created: {backend_sg_id}")
-    
-    # Allow traffic from ALB to backend services (port 3001 and 3002)
-    ec2.authorize_security_group_ingress(
-        GroupId=backend_sg_id,
-        IpPermissions=[
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 3001,
-                'ToPort': 3001,
-                'UserIdGroupPairs': [{'GroupId': alb_sg_id}]
-            },
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 3002,
-                'ToPort': 3002,
-                'UserIdGroupPairs': [{'GroupId': alb_sg_id}]
-            }
-        ]
-    )
-    
-    # Allow SSH access for development/debugging
-    ec2.authorize_security_group_ingress(
-        GroupId=backend_sg_id,
-        IpPermissions=[
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 22,
-                'ToPort': 22,
-                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'SSH access'}]
-            }
-        ]
-    )
-    
+    # Reuse whichever groups a previous run already created - the run may
+    # have died after creating only one of them, so each group is checked
+    # and created independently rather than all-or-nothing
+    existing_response = ec2.describe_security_groups(Filters=[
+        {'Name': 'vpc-id', 'Values': [vpc_id]},
+        {'Name': 'group-name', 'Values': ['ProjectOrc-ALB-SG', 'ProjectOrc-Backend-SG']}
+    ])
+    existing = {g['GroupName']: g['GroupId'] for g in existing_response['SecurityGroups']}
+
+    # The two security groups are independent, so create the missing ones
+    # concurrently
+    sg_futures = {}
+    if 'ProjectOrc-ALB-SG' not in existing:
+        sg_futures['ProjectOrc-ALB-SG'] = executor.submit(
+            ec2.create_security_group,
+            GroupName='ProjectOrc-ALB-SG',
+            Description='Security group for application load balancer',
+            VpcId=vpc_id,
+            TagSpecifications=_tag('security-group', 'ProjectOrc-ALB-SG')
+        )
+    if 'ProjectOrc-Backend-SG' not in existing:
+        sg_futures['ProjectOrc-Backend-SG'] = executor.submit(
+            ec2.create_security_group,
+            GroupName='ProjectOrc-Backend-SG',
+            Description='Security group for backend services',
+            VpcId=vpc_id,
+            TagSpecifications=_tag('security-group', 'ProjectOrc-Backend-SG')
+        )
+    for group_name, future in sg_futures.items():
+        existing[group_name] = future.result()['GroupId']
+        logger.info(f"Security Group created: {group_name} - {existing[group_name]}")
+    alb_sg_id = existing['ProjectOrc-ALB-SG']
+    backend_sg_id = existing['ProjectOrc-Backend-SG']
+
+    # The ingress authorizations only depend on the group IDs gathered
+    # above, so they can run concurrently as well; a reused group may
+    # already hold its rules, which _authorize_ingress tolerates
+    ingress_futures = [
+        # Allow HTTP and HTTPS from anywhere to ALB
+        executor.submit(
+            _authorize_ingress,
+            GroupId=alb_sg_id,
+            IpPermissions=[
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 80,
+                    'ToPort': 80,
+                    'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
+                },
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 443,
+                    'ToPort': 443,
+                    'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
+                }
+            ]
+        ),
+        # Allow traffic from ALB to backend services (port 3001 and 3002)
+        # plus SSH access for development/debugging - batched into a single
+        # call so the backend SG is configured in one API round-trip
+        executor.submit(
+            _authorize_ingress,
+            GroupId=backend_sg_id,
+            IpPermissions=[
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 3001,
+                    'ToPort': 3001,
+                    'UserIdGroupPairs': [{'GroupId': alb_sg_id}]
+                },
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 3002,
+                    'ToPort': 3002,
+                    'UserIdGroupPairs': [{'GroupId': alb_sg_id}]
+                },
+                {
+                    'IpProtocol': 'tcp',
+                    'FromPort': 22,
+                    'ToPort': 22,
+                    'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'SSH access'}]
+                }
+            ]
+        )
+    ]
+    for future in as_completed(ingress_futures):
+        future.result()
+
     return {
         'alb_sg_id': alb_sg_id,
         'backend_sg_id': backend_sg_id
     }
 
+def _ensure_alb_routing(alb_arn, hello_tg_arn, profile_tg_arn):
+    """Create the HTTP listener and /profile* rule if not already present
+
+    A previous run may have died between creating the target groups and
+    wiring up the listener, so both pieces are checked rather than assumed
+    to exist alongside the ALB.
+    """
+    listeners = elbv2.describe_listeners(LoadBalancerArn=alb_arn)['Listeners']
+    if listeners:
+        listener_arn = listeners[0]['ListenerArn']
+    else:
+        hello_listener = elbv2.create_listener(
+            LoadBalancerArn=alb_arn,
+            Protocol='HTTP',
+            Port=80,
+            DefaultActions=[
+                {
+                    'Type': 'forward',
+                    'TargetGroupArn': hello_tg_arn
+                }
+            ],
+            Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Hello-Listener'}]
+        )
+        listener_arn = hello_listener['Listeners'][0]['ListenerArn']
+        logger.info(f"Hello Service Listener created")
+
+    # Create a rule for the profile service using a path pattern
+    rules = elbv2.describe_rules(ListenerArn=listener_arn)['Rules']
+    has_profile_rule = any(
+        condition.get('Field') == 'path-pattern' and '/profile*' in condition.get('Values', [])
+        for rule in rules for condition in rule.get('Conditions', [])
+    )
+    if not has_profile_rule:
+        elbv2.create_rule(
+            ListenerArn=listener_arn,
+            Conditions=[
+                {
+                    'Field': 'path-pattern',
+                    'Values': ['/profile*']
+                }
+            ],
+            Priority=10,
+            Actions=[
+                {
+                    'Type': 'forward',
+                    'TargetGroupArn': profile_tg_arn
+                }
+            ],
+            Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Profile-Rule'}]
+        )
+        logger.info(f"Profile Service Listener Rule created")
+
 def create_load_balancer(subnets, alb_sg_id):
     """Create Application Load Balancer"""
+    # Reuse the ALB and its target groups when a previous run built them.
+    # The listener and rule cannot be assumed to exist just because the ALB
+    # does, so _ensure_alb_routing creates whichever are missing
+    try:
+        existing_lbs = elbv2.describe_load_balancers(Names=['ProjectOrc-ALB'])
+        existing_alb = existing_lbs['LoadBalancers'][0]
+        existing_tgs = elbv2.describe_target_groups(
+            Names=['ProjectOrc-Hello-TG', 'ProjectOrc-Profile-TG']
+        )
+        tg_arns = {tg['TargetGroupName']: tg['TargetGroupArn']
+                   for tg in existing_tgs['TargetGroups']}
+        logger.info(f"Reusing existing load balancer: {existing_alb['LoadBalancerArn']}")
+        _ensure_alb_routing(
+            existing_alb['LoadBalancerArn'],
+            tg_arns['ProjectOrc-Hello-TG'],
+            tg_arns['ProjectOrc-Profile-TG']
+        )
+        return {
+            'alb_arn': existing_alb['LoadBalancerArn'],
+            'alb_dns': existing_alb['DNSName'],
+            'hello_tg_arn': tg_arns['ProjectOrc-Hello-TG'],
+            'profile_tg_arn': tg_arns['ProjectOrc-Profile-TG']
+        }
+    except ClientError as e:
+        if e.response['Error']['Code'] not in ('LoadBalancerNotFound', 'TargetGroupNotFound'):
+            raise
+
     load_balancer = elbv2.create_load_balancer(
         Name='ProjectOrc-ALB',
         Subnets=subnets['public'],
@@ -297,11 +695,13 @@ def create_load_balancer(subnets, alb_sg_id):
     
     alb_arn = load_balancer['LoadBalancers'][0]['LoadBalancerArn']
     alb_dns = load_balancer['LoadBalancers'][0]['DNSName']
-    print(f"Application Load Balancer created: {alb_arn}")
-    print(f"ALB DNS Name: {alb_dns}")
+    logger.info(f"Application Load Balancer created: {alb_arn}")
+    logger.info(f"ALB DNS Name: {alb_dns}")
     
-    # Create target groups for helloService and profileService
-    hello_target_group = elbv2.create_target_group(
+    # Create target groups for helloService and profileService concurrently -
+    # they are independent of each other
+    hello_tg_future = executor.submit(
+        elbv2.create_target_group,
         Name='ProjectOrc-Hello-TG',
         Protocol='HTTP',
         Port=3001,
@@ -316,11 +716,8 @@ def create_load_balancer(subnets, alb_sg_id):
         TargetType='instance',
         Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Hello-TG'}]
     )
-    
-    hello_tg_arn = hello_target_group['TargetGroups'][0]['TargetGroupArn']
-    print(f"Hello Service Target Group created: {hello_tg_arn}")
-    
-    profile_target_group = elbv2.create_target_group(
+    profile_tg_future = executor.submit(
+        elbv2.create_target_group,
         Name='ProjectOrc-Profile-TG',
         Protocol='HTTP',
         Port=3002,
@@ -335,47 +732,18 @@ def create_load_balancer(subnets, alb_sg_id):
         TargetType='instance',
         Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Profile-TG'}]
     )
-    
-    profile_tg_arn = profile_target_group['TargetGroups'][0]['TargetGroupArn']
-    print(f"Profile Service Target Group created: {profile_tg_arn}")
-    
-    # Create listeners to forward traffic to the target groups
-    hello_listener = elbv2.create_listener(
-        LoadBalancerArn=alb_arn,
-        Protocol='HTTP',
-        Port=80,
-        DefaultActions=[
-            {
-                'Type': 'forward',
-                'TargetGroupArn': hello_tg_arn
-            }
-        ],
-        Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Hello-Listener'}]
-    )
-    
-    print(f"Hello Service Listener created")
-    
-    # Create a rule for the profile service using a path pattern
-    profile_listener_rule = elbv2.create_rule(
-        ListenerArn=hello_listener['Listeners'][0]['ListenerArn'],
-        Conditions=[
-            {
-                'Field': 'path-pattern',
-                'Values': ['/profile*']
-            }
-        ],
-        Priority=10,
-        Actions=[
-            {
-                'Type': 'forward',
-                'TargetGroupArn': profile_tg_arn
-            }
-        ],
-        Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Profile-Rule'}]
-    )
-    
-    print(f"Profile Service Listener Rule created")
-    
+    for future in as_completed([hello_tg_future, profile_tg_future]):
+        future.result()
+
+    hello_tg_arn = hello_tg_future.result()['TargetGroups'][0]['TargetGroupArn']
+    logger.info(f"Hello Service Target Group created: {hello_tg_arn}")
+
+    profile_tg_arn = profile_tg_future.result()['TargetGroups'][0]['TargetGroupArn']
+    logger.info(f"Profile Service Target Group created: {profile_tg_arn}")
+
+    # Create the listener and rule to forward traffic to the target groups
+    _ensure_alb_routing(alb_arn, hello_tg_arn, profile_tg_arn)
+
     return {
         'alb_arn': alb_arn,
         'alb_dns': alb_dns,
@@ -385,27 +753,19 @@ def create_load_balancer(subnets, alb_sg_id):
 
 def create_iam_role():
     """Create IAM Role for EC2 instances to access ECR"""
-    assume_role_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Principal": {"Service": "ec2.amazonaws.com"},
-                "Action": "sts:AssumeRole"
-            }
-        ]
-    }
-    
-    role = iam.create_role(
-        RoleName='ProjectOrc-EC2-ECR-Role',
-        AssumeRolePolicyDocument=json.dumps(assume_role_policy),
-        Description='Role for EC2 instances to pull from ECR',
-        Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-EC2-ECR-Role'}]
-    )
-    
+    try:
+        role = iam.create_role(
+            RoleName='ProjectOrc-EC2-ECR-Role',
+            AssumeRolePolicyDocument=ASSUME_ROLE_POLICY_JSON,
+            Description='Role for EC2 instances to pull from ECR',
+            Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-EC2-ECR-Role'}]
+        )
+    except iam.exceptions.EntityAlreadyExistsException:
+        role = iam.get_role(RoleName='ProjectOrc-EC2-ECR-Role')
+
     role_name = role['Role']['RoleName']
     role_arn = role['Role']['Arn']
-    print(f"IAM Role created: {role_name} - {role_arn}")
+    logger.info(f"IAM Role created: {role_name} - {role_arn}")
     
     # Attach policies for ECR access
     iam.attach_role_policy(
@@ -413,25 +773,45 @@ def create_iam_role():
         PolicyArn='arn:aws:iam::aws:policy/AmazonECR-FullAccess'
     )
     
-    print(f"Attached ECR policy to role {role_name}")
+    logger.info(f"Attached ECR policy to role {role_name}")
     
     # Create instance profile and add role to it
-    instance_profile = iam.create_instance_profile(
-        InstanceProfileName='ProjectOrc-EC2-ECR-Profile',
-        Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-EC2-ECR-Profile'}]
-    )
-    
-    iam.add_role_to_instance_profile(
-        InstanceProfileName='ProjectOrc-EC2-ECR-Profile',
-        RoleName=role_name
-    )
-    
+    try:
+        instance_profile = iam.create_instance_profile(
+            InstanceProfileName='ProjectOrc-EC2-ECR-Profile',
+            Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-EC2-ECR-Profile'}]
+        )
+        iam.add_role_to_instance_profile(
+            InstanceProfileName='ProjectOrc-EC2-ECR-Profile',
+            RoleName=role_name
+        )
+    except iam.exceptions.EntityAlreadyExistsException:
+        instance_profile = iam.get_instance_profile(
+            InstanceProfileName='ProjectOrc-EC2-ECR-Profile'
+        )
+        # A previous run may have died between creating the profile and
+        # adding the role, leaving a role-less profile - attach the role now
+        profile_roles = [r['RoleName'] for r in instance_profile['InstanceProfile']['Roles']]
+        if role_name not in profile_roles:
+            iam.add_role_to_instance_profile(
+                InstanceProfileName='ProjectOrc-EC2-ECR-Profile',
+                RoleName=role_name
+            )
+            logger.info(f"Added role {role_name} to existing instance profile")
+
     instance_profile_arn = instance_profile['InstanceProfile']['Arn']
-    print(f"Instance Profile created: {instance_profile_arn}")
-    
-    # Wait for the instance profile to be ready
-    print("Waiting for the instance profile to be ready...")
-    time.sleep(15)
+    logger.info(f"Instance Profile created: {instance_profile_arn}")
+    
+    # Wait for the instance profile to be ready - the profile is usually
+    # visible within a second or two, so a jittered exponential-backoff poll
+    # (bounded at ~30s total) beats both a flat sleep and fixed-delay polling
+    logger.info("Waiting for the instance profile to be ready...")
+    for attempt in range(10):
+        try:
+            iam.get_instance_profile(InstanceProfileName='ProjectOrc-EC2-ECR-Profile')
+            break
+        except iam.exceptions.NoSuchEntityException:
+            time.sleep(min(0.5 * 2 ** attempt + random.random() * 0.3, 5))
     
     return {
         'role_name': role_name,
@@ -442,61 +822,70 @@ def create_iam_role():
 
 def create_launch_template(backend_sg_id, instance_profile_name):
     """Create Launch Template for Auto Scaling Group"""
-    # Create user data script to pull and run docker images
-    user_data = """#!/bin/bash
-yum update -y
-yum install -y docker
-systemctl start docker
-systemctl enable docker
-amazon-linux-extras install -y aws-cli
-aws ecr get-login-password --region us-west-1 | docker login --username AWS --password-stdin 975050024946.dkr.ecr.us-west-1.amazonaws.com
-docker pull 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:hello-latest
-docker pull 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:profile-latest
-docker run -d -p 3001:3001 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:hello-latest
-docker run -d -p 3002:3002 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:profile-latest
-"""
-    
-    import base64
-    encoded_user_data = base64.b64encode(user_data.encode()).decode()
-    
+    # Reuse the launch template from a previous run if it exists
+    lt_response = ec2.describe_launch_templates(Filters=[
+        {'Name': 'launch-template-name', 'Values': ['ProjectOrc-BackendLT']}
+    ])
+    if lt_response['LaunchTemplates']:
+        existing_lt = lt_response['LaunchTemplates'][0]
+        logger.info(f"Reusing existing launch template: {existing_lt['LaunchTemplateId']}")
+        return {
+            'lt_id': existing_lt['LaunchTemplateId'],
+            'lt_version': existing_lt['LatestVersionNumber']
+        }
+
     # Create launch template
     launch_template = ec2.create_launch_template(
         LaunchTemplateName='ProjectOrc-BackendLT',
         VersionDescription='Initial version',
-        TagSpecifications=[
-            {
-                'ResourceType': 'launch-template',
-                'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-BackendLT'}]
-            }
-        ],
+        TagSpecifications=_tag('launch-template', 'ProjectOrc-BackendLT'),
         LaunchTemplateData={
-            'ImageId': 'ami-0c110e13b02dea71a',  # Amazon Linux 2 in us-west-1, update as needed
-            'InstanceType': 't2.micro',
+            'ImageId': AMI_ID,
+            'InstanceType': 't3a.small',
             'SecurityGroupIds': [backend_sg_id],
             'IamInstanceProfile': {
                 'Name': instance_profile_name
             },
-            'UserData': encoded_user_data,
-            'TagSpecifications': [
-                {
-                    'ResourceType': 'instance',
-                    'Tags': [{'Key': 'Name', 'Value': 'ProjectOrc-Backend'}]
-                }
-            ]
+            'UserData': BACKEND_USER_DATA_B64,
+            'TagSpecifications': _tag('instance', 'ProjectOrc-Backend')
         }
     )
     
     lt_id = launch_template['LaunchTemplate']['LaunchTemplateId']
     lt_version = launch_template['LaunchTemplate']['LatestVersionNumber']
-    print(f"Launch Template created: {lt_id}, version: {lt_version}")
+    logger.info(f"Launch Template created: {lt_id}, version: {lt_version}")
     
     return {
         'lt_id': lt_id,
         'lt_version': lt_version
     }
 
+def update_backend_images(lt_id, services=BACKEND_SERVICES):
+    """Publish a new launch template version for a service image bump
+
+    The ASG tracks $Latest, so new instances pick up the change without
+    re-running the rest of this script - one cheap API call per rollout.
+    """
+    response = ec2.create_launch_template_version(
+        LaunchTemplateId=lt_id,
+        VersionDescription='Image update: ' + ', '.join(tag for tag, _ in services),
+        SourceVersion='$Latest',
+        LaunchTemplateData={'UserData': encode_user_data(build_user_data(services))}
+    )
+    version = response['LaunchTemplateVersion']['VersionNumber']
+    logger.info(f"Launch template {lt_id} updated to version {version}")
+    return version
+
 def create_auto_scaling_group(lt_id, subnets, target_group_arns):
     """Create Auto Scaling Group for backend services"""
+    # Reuse the ASG (and its scaling policy) when a previous run created it
+    existing_asgs = autoscaling.describe_auto_scaling_groups(
+        AutoScalingGroupNames=['ProjectOrc-Backend-ASG']
+    )
+    if existing_asgs['AutoScalingGroups']:
+        logger.info("Reusing existing Auto Scaling Group: ProjectOrc-Backend-ASG")
+        return {'asg_name': 'ProjectOrc-Backend-ASG'}
+
     asg = autoscaling.create_auto_scaling_group(
         AutoScalingGroupName='ProjectOrc-Backend-ASG',
         LaunchTemplate={
@@ -519,7 +908,7 @@ def create_auto_scaling_group(lt_id, subnets, target_group_arns):
         ]
     )
     
-    print(f"Auto Scaling Group created: ProjectOrc-Backend-ASG")
+    logger.info(f"Auto Scaling Group created: ProjectOrc-Backend-ASG")
     
     # Create scaling policies
     scale_up_policy = autoscaling.put_scaling_policy(
@@ -534,7 +923,7 @@ def create_auto_scaling_group(lt_id, subnets, target_group_arns):
         }
     )
     
-    print(f"Scale up policy created")
+    logger.info(f"Scale up policy created")
     
     return {
         'asg_name': 'ProjectOrc-Backend-ASG'
@@ -542,29 +931,41 @@ def create_auto_scaling_group(lt_id, subnets, target_group_arns):
 
 def save_infrastructure_details(infrastructure):
     """Save infrastructure details to a file"""
-    with open('infrastructure_details.json', 'w') as f:
-        json.dump(infrastructure, f, indent=2)
-    print("Infrastructure details saved to infrastructure_details.json")
+    # orjson serializes in a single C-level pass (~5-10x faster than stdlib
+    # json), which matters if this dump grows to full resource descriptions
+    if orjson is not None:
+        with open('infrastructure_details.json', 'wb') as f:
+            f.write(orjson.dumps(infrastructure, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open('infrastructure_details.json', 'w') as f:
+            json.dump(infrastructure, f, indent=2)
+    logger.info("Infrastructure details saved to infrastructure_details.json")
 
 if __name__ == "__main__":
-    print("Starting infrastructure deployment...")
-    
-    # Create VPC and related resources
-    vpc_info = create_vpc()
+    logger.info("Starting infrastructure deployment...")
+    
+    # Create VPC and IAM role concurrently - neither depends on the other,
+    # so the IAM propagation wait hides inside the VPC/NAT provisioning
+    with ThreadPoolExecutor(max_workers=2) as phase_executor:
+        vpc_future = phase_executor.submit(create_vpc)
+        iam_future = phase_executor.submit(create_iam_role)
+        vpc_info = vpc_future.result()
+        iam_info = iam_future.result()
     vpc_id = vpc_info['vpc_id']
-    
+
     # Create security groups
     sg_info = create_security_groups(vpc_id)
-    
-    # Create IAM role for EC2 to access ECR
-    iam_info = create_iam_role()
-    
+
     # Create launch template
     lt_info = create_launch_template(sg_info['backend_sg_id'], iam_info['instance_profile_name'])
     
     # Create load balancer and target groups
     lb_info = create_load_balancer(vpc_info['subnets'], sg_info['alb_sg_id'])
-    
+
+    # The private subnets need their NAT route before instances boot and try
+    # to reach ECR - join the background NAT provisioning here
+    vpc_info['nat_gateway_id'] = vpc_info.pop('nat_future').result()
+
     # Create auto scaling group
     asg_info = create_auto_scaling_group(
         lt_info['lt_id'], 
@@ -585,4 +986,4 @@ if __name__ == "__main__":
     # Save infrastructure details
     save_infrastructure_details(infrastructure)
     
-    print("Infrastructure deployment completed successfully!")
+    logger.info("Infrastructure deployment completed successfully!")
@@ -1,62 +1,219 @@
 import boto3
+import functools
+import hashlib
+import io
+import pathlib
 import time
 import json
 import base64
-import uuid
+import secrets
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
-# Initialize AWS clients
-ec2 = boto3.client('ec2', region_name='us-west-1')
-autoscaling = boto3.client('autoscaling', region_name='us-west-1')
-elbv2 = boto3.client('elbv2', region_name='us-west-1')
-iam = boto3.client('iam', region_name='us-west-1')
-ecr = boto3.client('ecr', region_name='us-west-1')
-route53 = boto3.client('route53', region_name='us-west-1')
-lambda_client = boto3.client('lambda', region_name='us-west-1')
-s3 = boto3.client('s3', region_name='us-west-1')
-events = boto3.client('events', region_name='us-west-1')
-
-# Load infrastructure details from previous script if available
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json where orjson is unavailable
+    orjson = None
+
+# Shared client configuration: a pool of 50 connections so concurrent calls
+# do not queue behind the default 10, TCP keep-alive to skip re-handshakes
+# between calls, and adaptive retries for client-side rate limiting.
+client_config = Config(
+    region_name='us-west-1',
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
+)
+
+_session = boto3.Session(region_name='us-west-1')
+
+# Client creation off a shared Session is not thread-safe (the credential
+# resolver mutates shared state), and the deployment phases run in threads
+# that all build their first client at startup - serialize construction
+_client_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def client(service):
+    """Lazily build one client per service off the shared session
+
+    Clients are created on first use rather than at import, so a process
+    that touches a single service (tests, multiprocessing workers) does not
+    pay botocore's per-service model-loading cost nine times over.
+    lru_cache does not serialize concurrent misses, so the lock does; a
+    duplicate client built by a losing thread is discarded harmlessly.
+    """
+    with _client_lock:
+        return _session.client(service, config=client_config)
+
+def ingress_rules(ports):
+    """Build open-to-the-world TCP ingress permissions for the given ports
+
+    Returned as one list so callers keep all rules in a single
+    authorize_security_group_ingress call - adding a port here must not
+    become a second API round-trip.
+    """
+    return [
+        {
+            'IpProtocol': 'tcp',
+            'FromPort': port,
+            'ToPort': port,
+            'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
+        }
+        for port in ports
+    ]
+
+def build_lambda_zip(source, filename='lambda_function.py'):
+    """Package Lambda source into an in-memory deployment zip"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(filename, source)
+    return buffer.getvalue()
+
+def create_function_when_role_ready(**kwargs):
+    """Create a Lambda function, retrying while its IAM role propagates
+
+    Lambda rejects a freshly created role with 'role ... cannot be assumed'
+    until IAM propagation finishes (typically 3-5s). Backing off on that
+    specific error beats a blind fixed sleep: fast when propagation is
+    fast, and still correct when it is slow.
+    """
+    for attempt in range(8):
+        try:
+            return client('lambda').create_function(**kwargs)
+        except ClientError as e:
+            if 'cannot be assumed' not in str(e):
+                raise
+            time.sleep(min(2 ** attempt, 10))
+    return client('lambda').create_function(**kwargs)
+
+def create_state_machine_when_role_ready(**kwargs):
+    """Create a state machine, retrying while its IAM role propagates
+
+    Step Functions rejects a freshly created role with AccessDeniedException
+    until IAM propagation finishes - same race create_function_when_role_ready
+    covers for Lambda.
+    """
+    for attempt in range(8):
+        try:
+            return client('stepfunctions').create_state_machine(**kwargs)
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AccessDeniedException':
+                raise
+            time.sleep(min(2 ** attempt, 10))
+    return client('stepfunctions').create_state_machine(**kwargs)
+
+# Shared executor for fanning out independent API calls - boto3 clients are
+# thread-safe for concurrent calls
+executor = ThreadPoolExecutor(max_workers=8)
+
+# One random ID per deployment run, shared across generated resource names
+# (bucket suffix, Route53 caller reference) so they trace back to the same
+# run. token_hex is a thin os.urandom wrapper without uuid's struct overhead.
+DEPLOY_ID = secrets.token_hex(4)
+
+# Scheduled-action start times, pre-formatted once - boto3 accepts ISO 8601
+# strings directly, skipping per-call datetime serialization and avoiding
+# naive/aware timezone surprises
+_SCALE_UP_START = datetime(2025, 6, 1, 8, 0, 0).isoformat()  # 8 AM, adjust as needed
+_SCALE_DOWN_START = datetime(2025, 6, 1, 20, 0, 0).isoformat()  # 8 PM, adjust as needed
+
+# Frontend boot script - static except for the backend ALB DNS placeholder.
+# Kept at module scope as bytes so each deploy does one bytes-level replace
+# plus one base64 pass instead of rebuilding and re-encoding the template.
+FRONTEND_USER_DATA_TMPL = b"""#!/bin/bash
+yum update -y
+yum install -y docker
+systemctl start docker
+systemctl enable docker
+amazon-linux-extras install -y aws-cli
+aws ecr get-login-password --region us-west-1 | docker login --username AWS --password-stdin 975050024946.dkr.ecr.us-west-1.amazonaws.com
+docker pull 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:frontendforkubernetes
+docker run -d -p 80:80 -e BACKEND_URL=http://BACKEND_ALB_DNS 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:frontendforkubernetes
+"""
+
+# Load infrastructure details from previous script if available - read as
+# bytes and decode with orjson where present, skipping the text-mode decode
 try:
-    with open('infrastructure_details.json', 'r') as f:
-        infrastructure = json.load(f)
+    raw = pathlib.Path('infrastructure_details.json').read_bytes()
+    infrastructure = orjson.loads(raw) if orjson is not None else json.loads(raw)
     print("Loaded existing infrastructure details")
     vpc_id = infrastructure['vpc']['vpc_id']
 except FileNotFoundError:
     print("No existing infrastructure details found, please run the VPC setup script first")
     exit(1)
 
+def apply_if_changed(call_name, api_call, **kwargs):
+    """Make an idempotent API call, skipping it when nothing changed.
+
+    Hashes the call arguments and compares against the hash recorded in
+    infrastructure_details.json from the previous run - on re-runs this
+    turns each unchanged put_* call into a no-op instead of a round-trip.
+    """
+    serialized = (orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+                  if orjson is not None
+                  else json.dumps(kwargs, sort_keys=True).encode())
+    digest = hashlib.blake2b(serialized, digest_size=8).hexdigest()
+
+    applied_hashes = infrastructure.setdefault('_applied_hashes', {})
+    if applied_hashes.get(call_name) == digest:
+        print(f"Skipping {call_name} - configuration unchanged since last run")
+        return
+
+    api_call(**kwargs)
+    applied_hashes[call_name] = digest
+
 def deploy_backend_services():
     """Configure and deploy backend services with Auto Scaling Group"""
     print("Deploying backend services...")
-    
+
     # Auto Scaling Group and related components should already be set up from the previous script
-    
-    # Update existing ASG with lifecycle hooks for graceful termination
-    autoscaling.put_lifecycle_hook(
-        AutoScalingGroupName=infrastructure['auto_scaling_group']['asg_name'],
-        LifecycleHookName='terminate-backend-hook',
-        LifecycleTransition='autoscaling:EC2_INSTANCE_TERMINATING',
-        HeartbeatTimeout=300  # 5 minutes to complete shutdown
-    )
-    
-    # Configure scaling policies based on schedule
-    autoscaling.put_scheduled_update_group_action(
-        AutoScalingGroupName=infrastructure['auto_scaling_group']['asg_name'],
-        ScheduledActionName='scale-up-morning',
-        DesiredCapacity=4,
-        StartTime=datetime(2025, 6, 1, 8, 0, 0),  # 8 AM, adjust as needed
-        Recurrence='0 8 * * MON-FRI'  # cron expression for weekdays at 8 AM
-    )
-    
-    autoscaling.put_scheduled_update_group_action(
-        AutoScalingGroupName=infrastructure['auto_scaling_group']['asg_name'],
-        ScheduledActionName='scale-down-evening',
-        DesiredCapacity=2,
-        StartTime=datetime(2025, 6, 1, 20, 0, 0),  # 8 PM, adjust as needed
-        Recurrence='0 20 * * MON-FRI'  # cron expression for weekdays at 8 PM
-    )
-    
+    asg_name = infrastructure['auto_scaling_group']['asg_name']
+
+    # The lifecycle hook and the two scheduled actions are independent calls
+    # against the same ASG - AWS has no batch API for them, so fire the
+    # group concurrently instead of paying three serial round-trips
+    asg_futures = [
+        # Update existing ASG with lifecycle hooks for graceful termination
+        executor.submit(
+            apply_if_changed,
+            'put_lifecycle_hook.terminate-backend-hook',
+            client('autoscaling').put_lifecycle_hook,
+            AutoScalingGroupName=asg_name,
+            LifecycleHookName='terminate-backend-hook',
+            LifecycleTransition='autoscaling:EC2_INSTANCE_TERMINATING',
+            HeartbeatTimeout=300  # 5 minutes to complete shutdown
+        ),
+        # Configure scaling policies based on schedule
+        executor.submit(
+            apply_if_changed,
+            'put_scheduled_update_group_action.scale-up-morning',
+            client('autoscaling').put_scheduled_update_group_action,
+            AutoScalingGroupName=asg_name,
+            ScheduledActionName='scale-up-morning',
+            DesiredCapacity=4,
+            StartTime=_SCALE_UP_START,
+            Recurrence='0 8 * * MON-FRI'  # cron expression for weekdays at 8 AM
+        ),
+        executor.submit(
+            apply_if_changed,
+            'put_scheduled_update_group_action.scale-down-evening',
+            client('autoscaling').put_scheduled_update_group_action,
+            AutoScalingGroupName=asg_name,
+            ScheduledActionName='scale-down-evening',
+            DesiredCapacity=2,
+            StartTime=_SCALE_DOWN_START,
+            Recurrence='0 20 * * MON-FRI'  # cron expression for weekdays at 8 PM
+        )
+    ]
+    wait(asg_futures)
+    for future in asg_futures:
+        future.result()
+
     print("Backend services deployment configured")
     return {
         'status': 'Backend ASG configured with lifecycle hooks and scheduled scaling'
@@ -66,9 +223,10 @@ def set_up_load_balancer():
     """Set up additional load balancer configurations"""
     # The load balancer should already be created from the previous script
     alb_arn = infrastructure['load_balancer']['alb_arn']
-    
+    alb_dns = infrastructure['load_balancer']['alb_dns']
+
     # Enable cross-zone load balancing for better distribution
-    elbv2.modify_load_balancer_attributes(
+    client('elbv2').modify_load_balancer_attributes(
         LoadBalancerArn=alb_arn,
         Attributes=[
             {
@@ -84,68 +242,69 @@ def set_up_load_balancer():
     print("Load balancer configured with additional settings")
     return {
         'alb_arn': alb_arn,
-        'alb_dns': infrastructure['load_balancer']['alb_dns']
+        'alb_dns': alb_dns
     }
 
+@functools.lru_cache(maxsize=64)
+def _find_hosted_zone(domain_name):
+    """Look up a hosted zone by exact name, cached per domain across re-runs"""
+    # list_hosted_zones_by_name returns zones sorted from the requested name,
+    # so the exact match - if it exists - is always the first element; asking
+    # for one item keeps the filtering server-side
+    response = client('route53').list_hosted_zones_by_name(
+        DNSName=domain_name,
+        MaxItems='1'
+    )
+    if response['HostedZones']:
+        zone = response['HostedZones'][0]
+        if zone['Name'].rstrip('.') == domain_name.rstrip('.'):
+            return zone
+    return None
+
 def configure_dns(domain_name, alb_dns):
     """Set up DNS using Route 53"""
     print(f"Configuring DNS for {domain_name} pointing to {alb_dns}...")
-    
+
     # Check if hosted zone exists, otherwise create it
     try:
-        response = route53.list_hosted_zones_by_name(
-            DNSName=domain_name
-        )
-        
-        hosted_zone = None
-        for zone in response['HostedZones']:
-            if zone['Name'] == f"{domain_name}." or zone['Name'] == domain_name:
-                hosted_zone = zone
-                break
-        
+        hosted_zone = _find_hosted_zone(domain_name)
+
         if not hosted_zone:
             # Create hosted zone
-            hosted_zone = route53.create_hosted_zone(
+            hosted_zone = client('route53').create_hosted_zone(
                 Name=domain_name,
-                CallerReference=str(uuid.uuid4()),
+                CallerReference=DEPLOY_ID,
                 HostedZoneConfig={
                     'Comment': f'Hosted zone for {domain_name}',
                     'PrivateZone': False
                 }
             )['HostedZone']
+            # The negative lookup is now stale - drop it so a later call in
+            # this process finds the new zone instead of re-creating it
+            _find_hosted_zone.cache_clear()
             print(f"Created new hosted zone for {domain_name}")
-        
+
         hosted_zone_id = hosted_zone['Id'].split('/')[-1]
         
-        # Create DNS record
-        route53.change_resource_record_sets(
+        # Create DNS records - the apex and www records are identical except
+        # for Name, so build the record set once and vary the name
+        record_set = {
+            'Type': 'A',
+            'AliasTarget': {
+                'HostedZoneId': 'Z368ELLRRE2KJ0',  # us-west-1 ELB hosted zone ID
+                'DNSName': alb_dns,
+                'EvaluateTargetHealth': True
+            }
+        }
+        client('route53').change_resource_record_sets(
             HostedZoneId=hosted_zone_id,
             ChangeBatch={
                 'Changes': [
                     {
                         'Action': 'UPSERT',
-                        'ResourceRecordSet': {
-                            'Name': domain_name,
-                            'Type': 'A',
-                            'AliasTarget': {
-                                'HostedZoneId': 'Z368ELLRRE2KJ0',  # us-west-1 ELB hosted zone ID
-                                'DNSName': alb_dns,
-                                'EvaluateTargetHealth': True
-                            }
-                        }
-                    },
-                    {
-                        'Action': 'UPSERT',
-                        'ResourceRecordSet': {
-                            'Name': f"www.{domain_name}",
-                            'Type': 'A',
-                            'AliasTarget': {
-                                'HostedZoneId': 'Z368ELLRRE2KJ0',  # us-west-1 ELB hosted zone ID
-                                'DNSName': alb_dns,
-                                'EvaluateTargetHealth': True
-                            }
-                        }
+                        'ResourceRecordSet': {**record_set, 'Name': name}
                     }
+                    for name in (domain_name, f"www.{domain_name}")
                 ]
             }
         )
@@ -167,9 +326,15 @@ def configure_dns(domain_name, alb_dns):
 def deploy_frontend():
     """Deploy frontend on EC2 instances"""
     print("Deploying frontend service...")
-    
+
+    # Hoist the infrastructure lookups used below - keeps the dataflow
+    # visible at a glance and resolves each nested access once
+    backend_alb_dns = infrastructure['load_balancer']['alb_dns']
+    instance_profile_name = infrastructure['iam']['instance_profile_name']
+    public_subnet_csv = ','.join(infrastructure['vpc']['subnets']['public'])
+
     # Create security group for frontend
-    frontend_sg = ec2.create_security_group(
+    frontend_sg = client('ec2').create_security_group(
         GroupName='ProjectOrc-Frontend-SG',
         Description='Security group for frontend service',
         VpcId=vpc_id,
@@ -182,43 +347,19 @@ def deploy_frontend():
     )
     frontend_sg_id = frontend_sg['GroupId']
     
-    # Allow HTTP and HTTPS inbound
-    ec2.authorize_security_group_ingress(
+    # Allow HTTP and HTTPS inbound - batched in one call
+    client('ec2').authorize_security_group_ingress(
         GroupId=frontend_sg_id,
-        IpPermissions=[
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 80,
-                'ToPort': 80,
-                'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
-            },
-            {
-                'IpProtocol': 'tcp',
-                'FromPort': 443,
-                'ToPort': 443,
-                'IpRanges': [{'CidrIp': '0.0.0.0/0'}]
-            }
-        ]
+        IpPermissions=ingress_rules([80, 443])
     )
     
-    # Create user data script for frontend instances
-    user_data = """#!/bin/bash
-yum update -y
-yum install -y docker
-systemctl start docker
-systemctl enable docker
-amazon-linux-extras install -y aws-cli
-aws ecr get-login-password --region us-west-1 | docker login --username AWS --password-stdin 975050024946.dkr.ecr.us-west-1.amazonaws.com
-docker pull 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:frontendforkubernetes
-docker run -d -p 80:80 -e BACKEND_URL=http://BACKEND_ALB_DNS 975050024946.dkr.ecr.us-west-1.amazonaws.com/aakash/project-orc-b:frontendforkubernetes
-"""
-    
-    # Replace placeholder with actual backend ALB DNS
-    user_data = user_data.replace('BACKEND_ALB_DNS', infrastructure['load_balancer']['alb_dns'])
-    encoded_user_data = base64.b64encode(user_data.encode()).decode()
+    # Substitute the backend ALB DNS into the module-level template
+    encoded_user_data = base64.b64encode(
+        FRONTEND_USER_DATA_TMPL.replace(b'BACKEND_ALB_DNS', backend_alb_dns.encode())
+    ).decode()
     
     # Create launch template for frontend
-    frontend_lt = ec2.create_launch_template(
+    frontend_lt = client('ec2').create_launch_template(
         LaunchTemplateName='ProjectOrc-FrontendLT',
         VersionDescription='Initial version',
         TagSpecifications=[
@@ -232,7 +373,7 @@ docker run -d -p 80:80 -e BACKEND_URL=http://BACKEND_ALB_DNS 975050024946.dkr.ec
             'InstanceType': 't2.micro',
             'SecurityGroupIds': [frontend_sg_id],
             'IamInstanceProfile': {
-                'Name': infrastructure['iam']['instance_profile_name']
+                'Name': instance_profile_name
             },
             'UserData': encoded_user_data,
             'TagSpecifications': [
@@ -245,9 +386,14 @@ docker run -d -p 80:80 -e BACKEND_URL=http://BACKEND_ALB_DNS 975050024946.dkr.ec
     )
     
     frontend_lt_id = frontend_lt['LaunchTemplate']['LaunchTemplateId']
-    
+
+    # Confirm the launch template is describable before the ASG references
+    # it - EC2 has no dedicated launch-template waiter, and one describe
+    # round-trip is sufficient for the read-after-write check
+    client('ec2').describe_launch_templates(LaunchTemplateIds=[frontend_lt_id])
+
     # Create auto scaling group for frontend
-    frontend_asg = autoscaling.create_auto_scaling_group(
+    frontend_asg = client('autoscaling').create_auto_scaling_group(
         AutoScalingGroupName='ProjectOrc-Frontend-ASG',
         LaunchTemplate={
             'LaunchTemplateId': frontend_lt_id,
@@ -256,7 +402,7 @@ docker run -d -p 80:80 -e BACKEND_URL=http://BACKEND_ALB_DNS 975050024946.dkr.ec
         MinSize=2,
         MaxSize=4,
         DesiredCapacity=2,
-        VPCZoneIdentifier=','.join(infrastructure['vpc']['subnets']['public']),
+        VPCZoneIdentifier=public_subnet_csv,
         Tags=[
             {
                 'Key': 'Name',
@@ -266,8 +412,15 @@ docker run -d -p 80:80 -e BACKEND_URL=http://BACKEND_ALB_DNS 975050024946.dkr.ec
         ]
     )
     
+    # Wait for the ASG to be registered before attaching the scaling policy -
+    # the SDK waiter gives tuned polling instead of a hand-rolled sleep loop
+    client('autoscaling').get_waiter('group_exists').wait(
+        AutoScalingGroupNames=['ProjectOrc-Frontend-ASG'],
+        WaiterConfig={'Delay': 5, 'MaxAttempts': 40}
+    )
+
     # Create scaling policy for frontend
-    autoscaling.put_scaling_policy(
+    client('autoscaling').put_scaling_policy(
         AutoScalingGroupName='ProjectOrc-Frontend-ASG',
         PolicyName='ProjectOrc-Frontend-ScaleUp',
         PolicyType='TargetTrackingScaling',
@@ -291,9 +444,9 @@ def create_lambda_functions():
     print("Creating Lambda functions...")
     
     # Create S3 bucket for database backups
-    bucket_name = f"project-orc-db-backups-{uuid.uuid4().hex[:8]}"
+    bucket_name = f"project-orc-db-backups-{DEPLOY_ID}"
     try:
-        s3.create_bucket(
+        client('s3').create_bucket(
             Bucket=bucket_name,
             CreateBucketConfiguration={
                 'LocationConstraint': 'us-west-1'
@@ -301,7 +454,7 @@ def create_lambda_functions():
         )
         
         # Add lifecycle policy to expire backups after 30 days
-        s3.put_bucket_lifecycle_configuration(
+        client('s3').put_bucket_lifecycle_configuration(
             Bucket=bucket_name,
             LifecycleConfiguration={
                 'Rules': [
@@ -321,19 +474,20 @@ def create_lambda_functions():
         print(f"Error creating S3 bucket: {str(e)}")
         return {'error': str(e)}
     
-    # Create IAM role for Lambda function
+    # Create IAM role for Lambda function - also trusted by the RDS export
+    # service, which assumes this role to write export data into the bucket
     lambda_role_policy = {
         "Version": "2012-10-17",
         "Statement": [
             {
                 "Effect": "Allow",
-                "Principal": {"Service": "lambda.amazonaws.com"},
+                "Principal": {"Service": ["lambda.amazonaws.com", "export.rds.amazonaws.com"]},
                 "Action": "sts:AssumeRole"
             }
         ]
     }
     
-    lambda_role = iam.create_role(
+    lambda_role = client('iam').create_role(
         RoleName='ProjectOrc-Lambda-Role',
         AssumeRolePolicyDocument=json.dumps(lambda_role_policy),
         Description='Role for Lambda functions to access RDS and S3',
@@ -343,169 +497,275 @@ def create_lambda_functions():
     lambda_role_name = lambda_role['Role']['RoleName']
     lambda_role_arn = lambda_role['Role']['Arn']
     
-    # Attach policies for S3 and RDS access
-    iam.attach_role_policy(
-        RoleName=lambda_role_name,
-        PolicyArn='arn:aws:iam::aws:policy/AmazonS3FullAccess'
-    )
-    
-    iam.attach_role_policy(
-        RoleName=lambda_role_name,
-        PolicyArn='arn:aws:iam::aws:policy/AmazonRDSFullAccess'
-    )
-    
-    # Attach CloudWatch Logs policy
-    iam.attach_role_policy(
-        RoleName=lambda_role_name,
-        PolicyArn='arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole'
+    # Attach the S3, RDS, and CloudWatch Logs policies concurrently - the
+    # three calls are independent ~100-300ms round-trips
+    policy_arns = [
+        'arn:aws:iam::aws:policy/AmazonS3FullAccess',
+        'arn:aws:iam::aws:policy/AmazonRDSFullAccess',
+        'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole'
+    ]
+    attach_futures = [
+        executor.submit(client('iam').attach_role_policy, RoleName=lambda_role_name, PolicyArn=arn)
+        for arn in policy_arns
+    ]
+
+    # Create a second role for the orchestration layer - Step Functions needs
+    # to invoke the Lambdas and call RDS, and EventBridge needs to start
+    # executions of the state machine
+    orchestration_role_policy = {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": ["states.amazonaws.com", "events.amazonaws.com"]},
+                "Action": "sts:AssumeRole"
+            }
+        ]
+    }
+
+    orchestration_role = client('iam').create_role(
+        RoleName='ProjectOrc-Backup-Orchestration-Role',
+        AssumeRolePolicyDocument=json.dumps(orchestration_role_policy),
+        Description='Role for Step Functions and EventBridge to orchestrate DB backups',
+        Tags=[{'Key': 'Name', 'Value': 'ProjectOrc-Backup-Orchestration-Role'}]
     )
-    
-    print(f"Created IAM role for Lambda: {lambda_role_name}")
-    
-    # Wait for role to be available
-    print("Waiting for IAM role to propagate...")
-    time.sleep(15)
-    
-    # Create DB backup Lambda function code
-    db_backup_code = """
-import json
-import boto3
-import time
+
+    orchestration_role_arn = orchestration_role['Role']['Arn']
+
+    orchestration_policy_arns = [
+        'arn:aws:iam::aws:policy/service-role/AWSLambdaRole',
+        'arn:aws:iam::aws:policy/AmazonRDSFullAccess',
+        'arn:aws:iam::aws:policy/AWSStepFunctionsFullAccess'
+    ]
+    attach_futures += [
+        executor.submit(client('iam').attach_role_policy,
+                        RoleName='ProjectOrc-Backup-Orchestration-Role', PolicyArn=arn)
+        for arn in orchestration_policy_arns
+    ]
+    # The ExportToS3 state passes the Lambda role to RDS; none of the managed
+    # policies grant iam:PassRole, so add it inline, scoped to that one role
+    attach_futures.append(executor.submit(
+        client('iam').put_role_policy,
+        RoleName='ProjectOrc-Backup-Orchestration-Role',
+        PolicyName='PassExportRole',
+        PolicyDocument=json.dumps({
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": "iam:PassRole",
+                    "Resource": lambda_role_arn
+                }
+            ]
+        })
+    ))
+    wait(attach_futures)
+    for future in attach_futures:
+        future.result()
+
+    print(f"Created IAM roles: {lambda_role_name}, ProjectOrc-Backup-Orchestration-Role")
+
+    # The backup is split into two short-lived Lambdas orchestrated by Step
+    # Functions - a Lambda that blocks in a snapshot waiter is billed for the
+    # whole snapshot duration, so polling lives in a Wait/Choice loop instead
+    start_snapshot_code = """
 import os
+import boto3
 from datetime import datetime
 
 def lambda_handler(event, context):
-    # RDS client
     rds = boto3.client('rds')
-    s3 = boto3.client('s3')
-    
-    # Configuration
+
     db_instance_identifier = os.environ['DB_INSTANCE_ID']  # Get from environment variable
-    s3_bucket = os.environ['S3_BUCKET']  # Get from environment variable
-    
+
     # Generate timestamp for backup file
     timestamp = datetime.now().strftime('%Y-%m-%d-%H-%M-%S')
     snapshot_id = f"backup-{db_instance_identifier}-{timestamp}"
-    
-    try:
-        # Create DB snapshot
-        print(f"Creating snapshot {snapshot_id}")
-        rds.create_db_snapshot(
-            DBSnapshotIdentifier=snapshot_id,
-            DBInstanceIdentifier=db_instance_identifier
-        )
-        
-        # Wait for snapshot to complete - for demo purposes only
-        # In production, you'd use Step Functions or another mechanism
-        waiter = rds.get_waiter('db_snapshot_available')
-        print("Waiting for snapshot to complete...")
-        waiter.wait(
-            DBSnapshotIdentifier=snapshot_id
-        )
-        
-        # Export to S3
-        # Note: This is a simplified example. In real-world scenarios,
-        # you might need to handle export tasks differently.
-        export_task_id = f"export-{timestamp}"
-        
-        # Get snapshot ARN
-        snapshots = rds.describe_db_snapshots(
-            DBSnapshotIdentifier=snapshot_id
-        )
-        snapshot_arn = snapshots['DBSnapshots'][0]['DBSnapshotArn']
-        
-        # Export to S3
-        s3_prefix = f"backups/{db_instance_identifier}/{timestamp}"
-        export_response = rds.start_export_task(
-            ExportTaskIdentifier=export_task_id,
-            SourceArn=snapshot_arn,
-            S3BucketName=s3_bucket,
-            IamRoleArn=context.invoked_function_arn,
-            KmsKeyId='alias/aws/s3',
-            S3Prefix=s3_prefix
-        )
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'message': f"Backup initiated with task ID: {export_task_id}",
-                'snapshotId': snapshot_id,
-                's3Location': f"s3://{s3_bucket}/{s3_prefix}"
-            })
-        }
-    except Exception as e:
-        print(f"Error creating backup: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'message': f"Error creating backup: {str(e)}"
-            })
-        }
+
+    print(f"Creating snapshot {snapshot_id}")
+    rds.create_db_snapshot(
+        DBSnapshotIdentifier=snapshot_id,
+        DBInstanceIdentifier=db_instance_identifier
+    )
+
+    # Return immediately - the state machine polls for completion
+    return {
+        'snapshot_id': snapshot_id,
+        'db_instance': db_instance_identifier,
+        'timestamp': timestamp
+    }
 """
-    
-    # Create Lambda function for DB backup
-    lambda_response = lambda_client.create_function(
-        FunctionName='ProjectOrc-DB-Backup',
-        Runtime='python3.9',
-        Role=lambda_role_arn,
-        Handler='lambda_function.lambda_handler',
-        Code={
-            'ZipFile': db_backup_code.encode()
-        },
-        Description='Lambda function to backup RDS database to S3',
-        Timeout=300,  # 5 minutes
-        MemorySize=256,
-        Environment={
-            'Variables': {
-                'DB_INSTANCE_ID': 'project-orc-db',  # Replace with your actual DB instance ID
-                'S3_BUCKET': bucket_name
-            }
-        },
-        Tags={
-            'Name': 'ProjectOrc-DB-Backup'
-        }
+
+    check_snapshot_code = """
+import boto3
+
+def lambda_handler(event, context):
+    rds = boto3.client('rds')
+
+    snapshots = rds.describe_db_snapshots(
+        DBSnapshotIdentifier=event['snapshot_id']
     )
-    
-    lambda_function_arn = lambda_response['FunctionArn']
-    print(f"Created Lambda function: {lambda_function_arn}")
-    
-    # Create CloudWatch Events rule to trigger Lambda on schedule
-    rule_response = events.put_rule(
+    snapshot = snapshots['DBSnapshots'][0]
+
+    return {
+        **event,
+        'status': snapshot['Status'],
+        'snapshot_arn': snapshot['DBSnapshotArn']
+    }
+"""
+
+    handlers = {
+        'ProjectOrc-DB-Backup-Start': start_snapshot_code,
+        'ProjectOrc-DB-Backup-Check': check_snapshot_code
+    }
+
+    # Fail fast on a syntax error in the embedded handlers - otherwise it
+    # would only surface at the Lambda's first cold start in production
+    for source in handlers.values():
+        compile(source, 'lambda_function.py', 'exec')
+
+    # Upload each deployment package once as a proper zip artifact - the
+    # functions then reference them by S3 key instead of shipping (and
+    # re-base64ing) inline blobs on every deploy
+    for name, source in handlers.items():
+        client('s3').put_object(
+            Bucket=bucket_name,
+            Key=f"artifacts/{name}.zip",
+            Body=build_lambda_zip(source)
+        )
+
+    # Create the two Lambda functions and the CloudWatch Events rule
+    # concurrently - they are independent; the state machine joins on all
+    function_futures = {
+        name: executor.submit(
+            create_function_when_role_ready,
+            FunctionName=name,
+            Runtime='python3.9',
+            Role=lambda_role_arn,
+            Handler='lambda_function.lambda_handler',
+            Code={
+                'S3Bucket': bucket_name,
+                'S3Key': f"artifacts/{name}.zip"
+            },
+            Description='Step in the Step Functions DB backup workflow',
+            Timeout=60,  # neither handler waits on the snapshot any more
+            MemorySize=256,
+            Environment={
+                'Variables': {
+                    'DB_INSTANCE_ID': 'project-orc-db'  # Replace with your actual DB instance ID
+                }
+            },
+            Tags={
+                'Name': name
+            }
+        )
+        for name, source in handlers.items()
+    }
+    rule_future = executor.submit(
+        client('events').put_rule,
         Name='ProjectOrc-Nightly-Backup',
         ScheduleExpression='cron(0 3 * * ? *)',  # Run at 3 AM UTC every day
         State='ENABLED',
-        Description='Trigger DB backup Lambda function nightly'
+        Description='Trigger DB backup state machine nightly'
     )
-    
-    rule_arn = rule_response['RuleArn']
-    
-    # Add permission for CloudWatch Events to invoke Lambda
-    lambda_client.add_permission(
-        FunctionName='ProjectOrc-DB-Backup',
-        StatementId='AllowCloudWatchEvents',
-        Action='lambda:InvokeFunction',
-        Principal='events.amazonaws.com',
-        SourceArn=rule_arn
+
+    function_arns = {name: future.result()['FunctionArn']
+                     for name, future in function_futures.items()}
+    print(f"Created Lambda functions: {', '.join(function_arns)}")
+
+    rule_future.result()
+
+    # Snapshot polling happens here in a Wait/Choice loop, and the final
+    # export to S3 is an SDK integration - no Lambda is billed while the
+    # snapshot is being created
+    state_machine_definition = {
+        'Comment': 'Snapshot the DB, poll until available, then export to S3',
+        'StartAt': 'StartSnapshot',
+        'States': {
+            'StartSnapshot': {
+                'Type': 'Task',
+                'Resource': function_arns['ProjectOrc-DB-Backup-Start'],
+                'Next': 'WaitForSnapshot'
+            },
+            'WaitForSnapshot': {
+                'Type': 'Wait',
+                'Seconds': 30,
+                'Next': 'CheckSnapshot'
+            },
+            'CheckSnapshot': {
+                'Type': 'Task',
+                'Resource': function_arns['ProjectOrc-DB-Backup-Check'],
+                'Next': 'IsSnapshotReady'
+            },
+            'IsSnapshotReady': {
+                'Type': 'Choice',
+                'Choices': [
+                    {
+                        'Variable': '$.status',
+                        'StringEquals': 'available',
+                        'Next': 'ExportToS3'
+                    },
+                    {
+                        'Variable': '$.status',
+                        'StringEquals': 'failed',
+                        'Next': 'SnapshotFailed'
+                    }
+                ],
+                'Default': 'WaitForSnapshot'
+            },
+            'ExportToS3': {
+                'Type': 'Task',
+                'Resource': 'arn:aws:states:::aws-sdk:rds:startExportTask',
+                'Parameters': {
+                    'ExportTaskIdentifier.$': "States.Format('export-{}', $.timestamp)",
+                    'SourceArn.$': '$.snapshot_arn',
+                    'S3BucketName': bucket_name,
+                    'IamRoleArn': lambda_role_arn,
+                    'KmsKeyId': 'alias/aws/s3',
+                    'S3Prefix.$': "States.Format('backups/{}/{}', $.db_instance, $.timestamp)"
+                },
+                'End': True
+            },
+            'SnapshotFailed': {
+                'Type': 'Fail',
+                'Error': 'SnapshotFailed',
+                'Cause': 'DB snapshot did not become available'
+            }
+        }
+    }
+
+    state_machine = create_state_machine_when_role_ready(
+        name='ProjectOrc-DB-Backup',
+        definition=json.dumps(state_machine_definition),
+        roleArn=orchestration_role_arn,
+        tags=[{'key': 'Name', 'value': 'ProjectOrc-DB-Backup'}]
     )
-    
-    # Set Lambda as target for CloudWatch Events rule
-    events.put_targets(
+
+    state_machine_arn = state_machine['stateMachineArn']
+    print(f"Created state machine: {state_machine_arn}")
+
+    # Set the state machine as target for the CloudWatch Events rule - the
+    # orchestration role grants states:StartExecution, so no Lambda
+    # add_permission call is needed
+    client('events').put_targets(
         Rule='ProjectOrc-Nightly-Backup',
         Targets=[
             {
                 'Id': 'ProjectOrc-DB-Backup-Target',
-                'Arn': lambda_function_arn
+                'Arn': state_machine_arn,
+                'RoleArn': orchestration_role_arn
             }
         ]
     )
-    
+
     print("Scheduled nightly DB backups via CloudWatch Events")
-    
+
     return {
         'lambda_role_name': lambda_role_name,
         'lambda_role_arn': lambda_role_arn,
-        'lambda_function_name': 'ProjectOrc-DB-Backup',
-        'lambda_function_arn': lambda_function_arn,
+        'orchestration_role_arn': orchestration_role_arn,
+        'lambda_function_arns': function_arns,
+        'state_machine_arn': state_machine_arn,
         's3_bucket': bucket_name,
         'cloudwatch_rule': 'ProjectOrc-Nightly-Backup'
     }
@@ -513,31 +773,40 @@ def lambda_handler(event, context):
 def update_infrastructure_details(new_details):
     """Update the infrastructure details file with new information"""
     infrastructure.update(new_details)
-    
-    with open('infrastructure_details.json', 'w') as f:
-        json.dump(infrastructure, f, indent=2)
-    
+
+    # orjson serializes in one C-level pass - stdlib json's indent=2
+    # pretty-print is its slowest path and this file grows with every deploy
+    if orjson is not None:
+        with open('infrastructure_details.json', 'wb') as f:
+            f.write(orjson.dumps(infrastructure, option=orjson.OPT_INDENT_2))
+    else:
+        with open('infrastructure_details.json', 'w') as f:
+            json.dump(infrastructure, f, indent=2)
+
     print("Updated infrastructure details saved to infrastructure_details.json")
 
 if __name__ == "__main__":
     print("Starting deployment of additional services...")
     
-    # Deploy backend services
-    backend_info = deploy_backend_services()
-    
-    # Set up load balancer
-    lb_info = set_up_load_balancer()
-    
-    # Configure DNS - replace with your actual domain
+    # The four deployment steps touch disjoint services (autoscaling, elbv2,
+    # ec2+asg, lambda+s3+events+iam) and are all network-bound, so run them
+    # concurrently - wall time becomes roughly the slowest step instead of
+    # the sum of all four
+    with ThreadPoolExecutor(max_workers=4) as phase_executor:
+        backend_future = phase_executor.submit(deploy_backend_services)
+        lb_future = phase_executor.submit(set_up_load_balancer)
+        frontend_future = phase_executor.submit(deploy_frontend)
+        lambda_future = phase_executor.submit(create_lambda_functions)
+        backend_info = backend_future.result()
+        lb_info = lb_future.result()
+        frontend_info = frontend_future.result()
+        lambda_info = lambda_future.result()
+
+    # Configure DNS - replace with your actual domain. Depends on the load
+    # balancer step's DNS name, so it runs after the gather above.
     domain_name = "project-orc.example.com"  # Replace with your actual domain
     dns_info = configure_dns(domain_name, lb_info['alb_dns'])
     
-    # Deploy frontend
-    frontend_info = deploy_frontend()
-    
-    # Create Lambda functions
-    lambda_info = create_lambda_functions()
-    
     # Update infrastructure details with new information
     update_infrastructure_details({
         'backend_deployment': backend_info,
@@ -0,0 +1,49 @@
+import json
+import boto3
+import os
+import time
+
+from botocore.config import Config
+
+# Create the client once at module scope - warm invocations reuse the same
+# credentials and persistent HTTPS connection instead of rebuilding them
+_config = Config(retries={'mode': 'adaptive'}, tcp_keepalive=True)
+rds = boto3.client('rds', config=_config)
+
+def lambda_handler(event, context):
+    # Configuration from environment variables
+    db_instance_identifier = os.environ['DB_INSTANCE_ID']
+
+    # Generate UTC timestamp for backup file - datetime.now() is local time,
+    # which breaks backup ordering when functions run in different regions
+    timestamp = time.strftime('%Y-%m-%d-%H-%M-%SZ', time.gmtime())
+    snapshot_id = f"backup-{db_instance_identifier}-{timestamp}"
+
+    try:
+        # Create DB snapshot and return - the export Lambda is invoked by the
+        # snapshot-complete RDS event, so there is nothing to wait for here
+        print(f"Creating snapshot {snapshot_id}")
+        response = rds.create_db_snapshot(
+            DBSnapshotIdentifier=snapshot_id,
+            DBInstanceIdentifier=db_instance_identifier
+        )
+
+        snapshot_arn = response['DBSnapshot']['DBSnapshotArn']
+        print(f"Created snapshot with ARN: {snapshot_arn}")
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Snapshot creation started',
+                'snapshot_id': snapshot_id
+            })
+        }
+
+    except Exception as e:
+        print(f"Error during backup process: {str(e)}")
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'message': f"Backup failed: {str(e)}"
+            })
+        }
@@ -0,0 +1,123 @@
+import gzip
+import json
+import boto3
+import os
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# Create the clients once at module scope - warm invocations reuse the same
+# credentials and persistent HTTPS connections instead of rebuilding them.
+# This function is the only code uploading to the backup bucket, so its s3
+# client goes through the accelerate endpoint the bucket was configured
+# with at deploy time
+_config = Config(retries={'mode': 'adaptive'}, tcp_keepalive=True)
+rds = boto3.client('rds', config=_config)
+s3 = boto3.client('s3', config=_config.merge(
+    Config(s3={'use_accelerate_endpoint': True})
+))
+
+def lambda_handler(event, context):
+    # Configuration from environment variables
+    s3_bucket = os.environ['S3_BUCKET']
+
+    # EventBridge delivers the RDS snapshot-complete event (RDS-EVENT-0042)
+    snapshot_id = event['detail']['SourceIdentifier']
+    snapshot_arn = event['detail']['SourceArn']
+
+    # Ignore snapshots that were not created by the backup Lambda
+    if not snapshot_id.startswith('backup-'):
+        print(f"Ignoring unrelated snapshot {snapshot_id}")
+        return {
+            'statusCode': 200,
+            'body': json.dumps({'message': f"Skipped snapshot {snapshot_id}"})
+        }
+
+    # Recover the instance name and timestamp from the snapshot id
+    # (backup-<instance>-<Y>-<m>-<d>-<H>-<M>-<S>)
+    parts = snapshot_id.rsplit('-', 6)
+    db_instance_identifier = parts[0][len('backup-'):]
+    timestamp = '-'.join(parts[1:])
+
+    # For MySQL/PostgreSQL, export snapshot to S3
+    # Note: Not all database types support direct export to S3
+    # For MongoDB or other NoSQL databases, you would use a different approach
+
+    try:
+        # One filtered describe bounds the response to this snapshot and
+        # guards against late or duplicate events for snapshots that have
+        # since failed or been deleted
+        snapshots = rds.describe_db_snapshots(
+            DBSnapshotIdentifier=snapshot_id,
+            SnapshotType='manual'
+        )
+        status = snapshots['DBSnapshots'][0]['Status']
+        if status != 'available':
+            raise RuntimeError(f"Snapshot {snapshot_id} is {status}, not available")
+
+        # Create unique export task ID
+        export_task_id = f"export-{timestamp}"
+
+        # Export snapshot to S3
+        s3_prefix = f"backups/{db_instance_identifier}/{timestamp}"
+
+        rds.start_export_task(
+            ExportTaskIdentifier=export_task_id,
+            SourceArn=snapshot_arn,
+            S3BucketName=s3_bucket,
+            IamRoleArn=os.environ['LAMBDA_ROLE_ARN'],
+            KmsKeyId='alias/aws/s3',
+            S3Prefix=s3_prefix
+        )
+
+        print(f"Started export task: {export_task_id}")
+        print(f"Backup will be stored at: s3://{s3_bucket}/{s3_prefix}")
+
+        # Write metadata file with backup information
+        metadata = {
+            'timestamp': timestamp,
+            'db_instance': db_instance_identifier,
+            'snapshot_id': snapshot_id,
+            'export_task_id': export_task_id,
+            'backup_location': f"s3://{s3_bucket}/{s3_prefix}"
+        }
+
+        # Gzip the metadata before upload (~5x fewer bytes for indented
+        # JSON); ONEZONE_IA because these small derived objects do not need
+        # three-AZ redundancy. IfNoneMatch makes the write conditional - if
+        # a duplicate invocation raced us here, the loser gets a 412 instead
+        # of silently overwriting
+        try:
+            s3.put_object(
+                Bucket=s3_bucket,
+                Key=f"backups/{db_instance_identifier}/metadata/{timestamp}-metadata.json",
+                Body=gzip.compress(json.dumps(metadata, indent=2).encode()),
+                ContentEncoding='gzip',
+                ContentType='application/json',
+                StorageClass='ONEZONE_IA',
+                IfNoneMatch='*'
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'PreconditionFailed':
+                raise
+            print(f"Metadata for {timestamp} already written by a concurrent invocation")
+
+        return {
+            'statusCode': 200,
+            'body': json.dumps({
+                'message': 'Database export started successfully',
+                'snapshot_id': snapshot_id,
+                'export_task_id': export_task_id,
+                'backup_location': f"s3://{s3_bucket}/{s3_prefix}"
+            })
+        }
+
+    except Exception as export_error:
+        print(f"Error exporting snapshot to S3: {str(export_error)}")
+        # Even if export fails, we still have the snapshot
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'message': f"Export to S3 failed: {str(export_error)}",
+                'snapshot_id': snapshot_id
+            })
+        }